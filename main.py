@@ -5,24 +5,309 @@ A comprehensive audio transcription application using OpenAI Whisper,
 built with proper state management and clean class-based design.
 """
 
-import tempfile
+import functools
+import math
+import os
+import queue
+import shutil
 import threading
 import time
 import tkinter as tk
+from dataclasses import dataclass, field
 from pathlib import Path
 from tkinter import scrolledtext, ttk
-from typing import Callable
+from typing import Callable, Literal
 
-import keyboard
 import numpy as np
-import pyperclip
-import scipy.io.wavfile as wav
 import sounddevice as sd
+import torch
 import whisper
-from pydantic import BaseModel, Field, PrivateAttr
+from faster_whisper import WhisperModel
+from faster_whisper.vad import VadOptions, get_speech_timestamps
+from pydantic import BaseModel, Field
+from pynput.keyboard import GlobalHotKeys
 from whisper import _MODELS
+from whisper.audio import N_SAMPLES, SAMPLE_RATE
 from whisper.tokenizer import LANGUAGES as WHISPER_LANGS
 
+# Exported ONNX models live next to whisper's own download cache
+_ONNX_CACHE_DIR = Path(os.getenv("XDG_CACHE_HOME", Path.home() / ".cache")) / "whisper-onnx"
+
+# Hugging Face checkpoint names for openai-whisper aliases
+_HF_MODEL_ALIASES = {"large-v1": "large", "large": "large-v3", "turbo": "large-v3-turbo"}
+
+# One inference thread per physical core, up to 8; SMT siblings and very wide pools only add sync overhead
+# to the small decoder matmuls
+_CPU_THREADS = int(os.getenv("WHISPER_THREADS", "0")) or min(8, max(1, (os.cpu_count() or 2) // 2))
+
+# Dropdown choices, built once at import rather than per window
+_LANGUAGE_CODES = {"Autodetect": None, **{name.capitalize(): code for code, name in WHISPER_LANGS.items()}}
+_LANGUAGE_NAMES = ("Autodetect", *sorted(name for name, code in _LANGUAGE_CODES.items() if code))
+_MODEL_NAMES = tuple(_MODELS)
+
+
+class TranscriptSegment(BaseModel):
+    """A transcribed span of audio."""
+
+    start: float = Field(..., description="Segment start in seconds")
+    end: float = Field(..., description="Segment end in seconds")
+    text: str = Field(..., description="Transcribed text")
+
+
+def export_onnx_model(model_id: str, export_dir: Path) -> None:
+    """Export a Hugging Face Whisper checkpoint to ONNX with fused attention and int8 weights."""
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+    from onnxruntime.transformers.optimizer import optimize_model
+    from optimum.onnxruntime import ORTModelForSpeechSeq2Seq
+    from transformers import WhisperProcessor
+
+    # Build in a scratch directory so an interrupted export is never picked up as complete
+    tmp_dir = export_dir.with_name(f"{export_dir.name}.tmp")
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    model = ORTModelForSpeechSeq2Seq.from_pretrained(model_id, export=True)
+    model.save_pretrained(tmp_dir)
+    WhisperProcessor.from_pretrained(model_id).save_pretrained(tmp_dir)
+
+    # Weights are written as external data throughout, since the fp32 large encoders exceed protobuf's 2 GB limit
+    for onnx_path in list(tmp_dir.glob("*.onnx")):
+        optimized_path = onnx_path.with_suffix(".optimized.onnx")
+        # onnxruntime optimizes Whisper as a BART-style encoder-decoder, fusing multi-head attention
+        optimized = optimize_model(str(onnx_path), model_type="bart", num_heads=model.config.encoder_attention_heads, hidden_size=model.config.d_model)
+        optimized.save_model_to_file(str(optimized_path), use_external_data_format=True)
+        del optimized
+
+        # Drop the exported model and its weights so only the quantized model is left under its name
+        onnx_path.unlink()
+        onnx_path.with_name(f"{onnx_path.name}_data").unlink(missing_ok=True)
+        quantize_dynamic(optimized_path, onnx_path, weight_type=QuantType.QInt8, use_external_data_format=True)
+        optimized_path.unlink()
+        optimized_path.with_name(f"{optimized_path.name}.data").unlink(missing_ok=True)
+
+    tmp_dir.rename(export_dir)
+
+
+class OnnxWhisper:
+    """Int8 ONNX Runtime Whisper model running on the CPU execution provider."""
+
+    def __init__(self, name: str):
+        import onnxruntime
+        from optimum.onnxruntime import ORTModelForSpeechSeq2Seq
+        from transformers import WhisperProcessor
+
+        export_dir = _ONNX_CACHE_DIR / f"{name}-int8"
+        if not export_dir.exists():
+            export_onnx_model(f"openai/whisper-{_HF_MODEL_ALIASES.get(name, name)}", export_dir)
+
+        self.processor = WhisperProcessor.from_pretrained(export_dir)
+        options = onnxruntime.SessionOptions()
+        options.intra_op_num_threads = _CPU_THREADS
+        self.model = ORTModelForSpeechSeq2Seq.from_pretrained(export_dir, provider="CPUExecutionProvider", session_options=options)
+
+    def transcribe(self, audio: np.ndarray, language: str | None = None) -> list[TranscriptSegment]:
+        """Transcribe audio in consecutive 30 second windows, one segment per window."""
+        generate_kwargs = {"task": "transcribe", "language": language} if language else {"task": "transcribe"}
+        segments = []
+        for start in range(0, len(audio), N_SAMPLES):
+            chunk = audio[start : start + N_SAMPLES]
+            features = self.processor(chunk, sampling_rate=SAMPLE_RATE, return_tensors="pt").input_features
+            tokens = self.model.generate(features, **generate_kwargs)
+            text = self.processor.batch_decode(tokens, skip_special_tokens=True)[0]
+            segments.append(TranscriptSegment(start=start / SAMPLE_RATE, end=(start + len(chunk)) / SAMPLE_RATE, text=text))
+        return segments
+
+
+TranscriptionModel = whisper.Whisper | WhisperModel | OnnxWhisper
+
+
+def pcm16_to_float32(samples: np.ndarray) -> np.ndarray:
+    """Convert int16 PCM samples to the flat float32 [-1, 1) signal Whisper expects."""
+    return np.multiply(samples.ravel(), 1 / 32768, dtype=np.float32)
+
+
+def audio_stats(audio: np.ndarray) -> tuple[float, float]:
+    """Return the peak level and RMS of float32 audio without allocating temporary arrays."""
+    if not audio.size:
+        return 0.0, 0.0
+    peak = max(float(audio.max()), -float(audio.min()))
+    rms = math.sqrt(float(np.dot(audio, audio)) / audio.size)
+    return peak, rms
+
+
+def trim_silence(audio: np.ndarray, window: int = 2048, cutoff_db: float = -60.0) -> np.ndarray:
+    """Cut leading and trailing windows whose mean power is more than cutoff_db below the loudest window."""
+    if len(audio) <= window:
+        return audio
+    starts = np.arange(0, len(audio), window)
+    power = np.add.reduceat(np.square(audio), starts) / np.diff(starts, append=len(audio))
+    loud = np.flatnonzero(power > power.max() * 10 ** (cutoff_db / 10))
+    if not loud.size:
+        return audio[:0]
+    return audio[starts[loud[0]] : starts[loud[-1]] + window]
+
+
+def remove_silence(audio: np.ndarray) -> np.ndarray:
+    """Keep only the speech Silero VAD finds in 16 kHz audio, dropping pauses longer than 500 ms."""
+    # faster-whisper bundles Silero VAD as ONNX, so nothing is fetched from the network at runtime
+    spans = get_speech_timestamps(audio, VadOptions(min_silence_duration_ms=500))
+    if not spans:
+        return audio[:0]
+    return np.concatenate([audio[span["start"] : span["end"]] for span in spans])
+
+
+# Loaded models keyed by (backend, model name, device, quantized, compute type, compiled), shared across transcriptions
+_MODEL_CACHE: dict[tuple[str, str, str, bool, str, bool], TranscriptionModel] = {}
+_MODEL_CACHE_LOCK = threading.Lock()
+
+
+def quantize_int8(model: whisper.Whisper) -> whisper.Whisper:
+    """Quantize the Linear layers of a CPU Whisper model to int8 in place."""
+    # whisper's Linear subclass only casts weights to the input dtype, a no-op in fp32, but
+    # quantize_dynamic matches exact module types, so demote them to plain nn.Linear first
+    for module in model.modules():
+        if isinstance(module, torch.nn.Linear):
+            module.__class__ = torch.nn.Linear
+    return torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True)
+
+
+def compile_whisper(model: whisper.Whisper) -> whisper.Whisper:
+    """Compile a CUDA Whisper model's encoder with torch.compile."""
+    # Default mode rather than CUDA graphs, whose per-thread state breaks when the preload thread warms up the
+    # model and the worker thread runs it. The decoder stays eager: its kv-cache comes from forward hooks that
+    # openai-whisper installs and removes on every decode, which dynamo does not guard on.
+    model.encoder = torch.compile(model.encoder)
+    return model
+
+
+def resolve_device(device: str) -> str:
+    """Resolve the "auto" device setting to CUDA when a GPU is available, else CPU."""
+    if device == "auto":
+        return "cuda" if torch.cuda.is_available() else "cpu"
+    return device
+
+
+def get_model(name: str, backend: str, device: str = "auto", quantize: bool = False, compute_type: str = "auto", compile_model: bool = False, exclusive: bool = False) -> TranscriptionModel:
+    """Return a loaded model, loading it only on first use; exclusive first drops every other cached model."""
+    # The ONNX Runtime path only targets the CPU execution provider
+    device = "cpu" if backend == "onnx" else resolve_device(device)
+    # faster-whisper is already int8 on CPU and dynamic int8 kernels are CPU-only
+    quantize = quantize and backend == "whisper" and device == "cpu"
+    # Inductor kernel fusion and CUDA graphs only pay off for the PyTorch backend on GPU
+    compile_model = compile_model and backend == "whisper" and device == "cuda"
+    key = (backend, name, device, quantize, compute_type, compile_model)
+    with _MODEL_CACHE_LOCK:
+        if exclusive and _MODEL_CACHE.keys() - {key}:
+            for stale_key in _MODEL_CACHE.keys() - {key}:
+                del _MODEL_CACHE[stale_key]
+            if torch.cuda.is_available():
+                torch.cuda.empty_cache()
+        model = _MODEL_CACHE.get(key)
+        if model is None:
+            if backend == "faster-whisper":
+                # CTranslate2 int8 GEMM on CPU, and int8 weights with float16 activations on GPU. Like the
+                # fp16 flag below, half precision falls back to the CPU default since CPU has no such kernels.
+                if compute_type == "auto" or (device == "cpu" and compute_type in ("float16", "bfloat16")):
+                    compute_type = "int8_float16" if device == "cuda" else "int8"
+                model = WhisperModel(name, device=device, compute_type=compute_type, cpu_threads=_CPU_THREADS)
+            elif backend == "onnx":
+                model = OnnxWhisper(name)
+            else:
+                model = whisper.load_model(name, device=device)
+                if quantize:
+                    model = quantize_int8(model)
+                if compile_model:
+                    model = compile_whisper(model)
+                # openai-whisper only switches fp16 decoding on or off; bfloat16 runs float32 matmuls in bf16
+                # (set at startup), and CPU has no fp16 kernels so would only warn and fall back
+                model.fp16 = device == "cuda" and compute_type in ("auto", "float16")
+            _MODEL_CACHE[key] = model
+    return model
+
+
+# Serializes inference across the transcription worker, streaming and warm-up threads. openai-whisper's
+# kv-cache hooks live on the model, so two concurrent decodes on one model corrupt each other's cache.
+_INFERENCE_LOCK = threading.Lock()
+
+
+@torch.inference_mode()
+def transcribe_segments(model: TranscriptionModel, audio: np.ndarray, language: str | None = None, initial_prompt: str | None = None, accurate: bool = False) -> list[TranscriptSegment]:
+    """Transcribe 16 kHz mono float32 audio with any backend and return timed segments."""
+    if isinstance(model, OnnxWhisper):
+        # The ONNX export has no prompt input, so earlier context is not carried over
+        with _INFERENCE_LOCK:
+            return model.transcribe(audio, language)
+
+    # Dictation decodes greedily at temperature 0 with no fallback retries; accuracy mode uses 5-beam search with
+    # temperature fallback, faster-whisper's defaults
+    if isinstance(model, WhisperModel):
+        options = {} if accurate else {"beam_size": 1, "temperature": 0.0}
+        with _INFERENCE_LOCK:
+            segments, _ = model.transcribe(audio, language=language, initial_prompt=initial_prompt, vad_filter=True, **options)
+            # The segments are a lazy generator, so decoding happens while they are collected
+            return [TranscriptSegment(start=segment.start, end=segment.end, text=segment.text) for segment in segments]
+
+    # openai-whisper's own default is greedy, so the beams are requested explicitly
+    options = {"beam_size": 5, "best_of": 5} if accurate else {"temperature": 0.0}
+    if language:
+        options["language"] = language
+    with _INFERENCE_LOCK:
+        result = model.transcribe(audio, initial_prompt=initial_prompt, fp16=model.fp16, **options)
+    return [TranscriptSegment(start=segment["start"], end=segment["end"], text=segment["text"]) for segment in result["segments"]]
+
+
+# Guards the pinned staging buffer, which is reused by every upload
+_PINNED_LOCK = threading.Lock()
+
+
+@functools.cache
+def get_pinned_buffer() -> torch.Tensor:
+    """Allocate one page-locked 30 second window, so uploads to the GPU can DMA straight from it."""
+    return torch.empty(N_SAMPLES, dtype=torch.float32, pin_memory=True)
+
+
+def upload_audio(audio: np.ndarray, device: torch.device) -> torch.Tensor:
+    """Copy audio of at most 30 seconds to the device, staging it in pinned memory for CUDA."""
+    if device.type != "cuda":
+        return torch.from_numpy(audio).to(device)
+    with _PINNED_LOCK:
+        staging = get_pinned_buffer()[: len(audio)]
+        staging.numpy()[:] = audio
+        # Synchronous so the staging buffer is free again once the lock is released
+        return staging.to(device)
+
+
+@torch.inference_mode()
+def decode_window(model: whisper.Whisper, audio: np.ndarray, language: str | None = None, initial_prompt: str | None = None) -> str:
+    """Decode up to 30 seconds of audio in one pass, computing the mel spectrogram on the model's device."""
+    audio_t = upload_audio(audio, model.device)
+    mel = whisper.log_mel_spectrogram(whisper.pad_or_trim(audio_t), model.dims.n_mels)
+    options = whisper.DecodingOptions(task="transcribe", language=language, prompt=initial_prompt, temperature=0.0, without_timestamps=True, fp16=model.fp16)
+    with _INFERENCE_LOCK:
+        return whisper.decode(model, mel, options).text
+
+
+def transcribe(model: TranscriptionModel, audio: np.ndarray, language: str | None = None, initial_prompt: str | None = None, accurate: bool = False) -> str:
+    """Transcribe 16 kHz mono float32 audio with any backend and return the text."""
+    # Clips that fit one window skip transcribe()'s CPU mel, seek loop, segmentation and fallback
+    if isinstance(model, whisper.Whisper) and not accurate and len(audio) <= N_SAMPLES:
+        return decode_window(model, audio, language, initial_prompt)
+
+    return "".join(segment.text for segment in transcribe_segments(model, audio, language, initial_prompt, accurate))
+
+
+def warm_up(model: TranscriptionModel) -> None:
+    """Run one dummy decode so kernel setup and thread-pool spin-up happen before the first real recording."""
+    silence = np.zeros(SAMPLE_RATE, dtype=np.float32)
+    # Every backend filters through Silero VAD, so load its session now rather than on the first recording
+    remove_silence(silence)
+    if isinstance(model, WhisperModel):
+        # Calling the model directly, since the VAD filter would drop the silence before it reaches the model
+        with _INFERENCE_LOCK:
+            segments, _ = model.transcribe(silence, language="en", beam_size=1)
+            list(segments)
+    else:
+        transcribe(model, silence, "en")
+
 
 class AudioDeviceInfo(BaseModel):
     """Audio device information with validation."""
@@ -37,30 +322,60 @@ class TranscriberConfig(BaseModel):
     """Configuration for the transcriber application."""
 
     hotkey: str = Field(default="ctrl+shift+space", description="Global hotkey for recording")
-    sample_rate: int = Field(default=16000, description="Audio sample rate in Hz")
+    sample_rate: Literal[16000] = Field(default=16000, description="Audio sample rate in Hz, fixed to the 16 kHz the models and VAD expect")
+    block_size: int = Field(default=1600, description="Frames per recording callback (100 ms at 16 kHz)")
+    latency_mode: Literal["low", "high"] = Field(default="low", description="PortAudio input latency hint, low keeps less audio buffered")
     window_size: str = Field(default="700x600", description="GUI window dimensions")
     max_parallel_audio: int = Field(default=1, description="Max concurrent audio operations")
     default_model: str = Field(default="base", description="Default Whisper model")
+    device: Literal["auto", "cuda", "cpu"] = Field(default="auto", description="Inference device, auto picks CUDA when available")
+    backend: Literal["faster-whisper", "whisper", "onnx"] = Field(default="faster-whisper", description="Transcription backend")
+    quantize: bool = Field(default=True, description="Quantize openai-whisper models to int8 when running on CPU")
+    compute_type: Literal["auto", "float16", "bfloat16", "float32"] = Field(default="auto", description="Floating point precision, auto uses float16 on CUDA and int8 weights for faster-whisper")
+    accuracy_mode: bool = Field(default=False, description="Decode with 5-beam search and temperature fallback instead of greedily")
     default_language: str = Field(default="Autodetect", description="Default transcription language")
     test_duration: int = Field(default=5, description="Audio test duration in seconds")
     min_recording_duration: float = Field(default=0.5, description="Minimum recording length in seconds")
+    max_recording_duration: int = Field(default=600, description="Maximum recording length in seconds")
+    device_cache_ttl: float = Field(default=30.0, description="Seconds a queried device list is reused before Refresh Devices asks the driver again")
     silence_threshold: float = Field(default=0.001, description="Audio silence detection threshold")
+    vad_filter: bool = Field(default=True, description="Cut silence with Silero VAD before transcribing (faster-whisper always filters)")
+    streaming: bool = Field(default=False, description="Transcribe long recordings incrementally while recording")
+    stream_window: float = Field(default=20.0, description="Seconds of audio per streaming transcription window")
+    stream_preview_interval: float = Field(default=5.0, description="Seconds between provisional transcripts of not yet committed audio while streaming, 0 disables them")
+    use_compile: bool = Field(default=False, description="Compile the openai-whisper encoder with torch.compile on CUDA (slow first load)")
+    warmup_on_start: bool = Field(default=True, description="Load and warm up the default model at startup instead of on the first recording")
 
 
-class TranscriberState(BaseModel):
-    """Current state of the transcriber application."""
+class StreamProgress(BaseModel):
+    """Transcript committed so far while a recording is still in progress."""
 
-    is_listening: bool = Field(default=False, description="Currently recording audio")
-    is_testing_audio: bool = Field(default=False, description="Currently testing audio input")
-    current_device_index: int | None = Field(default=None, description="Selected audio device index")
-    selected_model: str = Field(default="base", description="Currently selected Whisper model")
-    selected_language: str = Field(default="Autodetect", description="Currently selected language")
+    text: str = Field(default="", description="Committed transcript text")
+    samples: int = Field(default=0, description="Number of recorded samples covered by the committed text")
+    started: bool = Field(default=False, description="Whether the recording's line has been started in the display")
+
+
+# A slotted dataclass rather than a pydantic model: the audio callback reads these flags for every block
+@dataclass(slots=True)
+class TranscriberState:
+    """Current state of the transcriber application."""
 
-    # Runtime state (not serialized)
-    _recording_data: list[np.ndarray] = PrivateAttr(default_factory=list)
-    _audio_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
-    _recording_stream: object | None = PrivateAttr(default=None)
-    _test_stream: object | None = PrivateAttr(default=None)
+    is_listening: bool = False  # Currently recording audio
+    is_testing_audio: bool = False  # Currently testing audio input
+    current_device_index: int | None = None  # Selected audio device index
+    selected_model: str = "base"  # Currently selected Whisper model
+    selected_language: str = "Autodetect"  # Currently selected language
+
+    # Runtime state
+    _recording_buffer: np.ndarray | None = field(default=None, init=False, repr=False)
+    _recording_length: int = field(default=0, init=False, repr=False)
+    _audio_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    _input_stream: object | None = field(default=None, init=False, repr=False)
+    _stream_thread: threading.Thread | None = field(default=None, init=False, repr=False)
+    _stream_progress: StreamProgress | None = field(default=None, init=False, repr=False)
+    _latest_level: float | None = field(default=None, init=False, repr=False)
+    _test_stop: threading.Event = field(default_factory=threading.Event, init=False, repr=False)
+    _transcription_jobs: queue.Queue = field(default_factory=queue.Queue, init=False, repr=False)
 
     @property
     def is_audio_busy(self) -> bool:
@@ -75,16 +390,21 @@ class WhisperTranscriber:
         self.config = config or TranscriberConfig()
         self.state = TranscriberState(selected_model=self.config.default_model, selected_language=self.config.default_language)
 
-        # Language mappings
-        self._languages = {"Autodetect": None, **{v.capitalize(): k for k, v in WHISPER_LANGS.items()}}
-        self._models = list(_MODELS.keys())
-
         # GUI components (initialized in setup_gui)
         self.root: tk.Tk | None = None
         self._gui_components: dict[str, tk.Widget] = {}
+        self._hotkey_listener: GlobalHotKeys | None = None
+
+        # Widgets updated on every status change, transcription and level poll, bound directly to skip dict lookups
+        self._status_label: ttk.Label | None = None
+        self._audio_level_label: ttk.Label | None = None
+        self._text_display: scrolledtext.ScrolledText | None = None
+        self._test_audio_button: ttk.Button | None = None
+        self._record_button: ttk.Button | None = None
 
         # Audio devices cache
         self._audio_devices: list[AudioDeviceInfo] = []
+        self._device_cache: tuple[list[AudioDeviceInfo], AudioDeviceInfo | None, float] = ([], None, -math.inf)
 
     def get_audio_devices(self) -> list[AudioDeviceInfo]:
         """Get list of available audio input devices."""
@@ -118,6 +438,7 @@ class WhisperTranscriber:
         self.root = tk.Tk()
         self.root.title("Whisper Transcriber")
         self.root.geometry(self.config.window_size)
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
 
         # Main frame
         main_frame = ttk.Frame(self.root, padding="10")
@@ -135,6 +456,12 @@ class WhisperTranscriber:
         self._create_control_buttons_section(main_frame)
         self._create_text_display_section(main_frame)
 
+        self._status_label = self._gui_components["status_label"]
+        self._audio_level_label = self._gui_components["audio_level_label"]
+        self._text_display = self._gui_components["text_display"]
+        self._test_audio_button = self._gui_components["test_audio_button"]
+        self._record_button = self._gui_components["record_button"]
+
         # Initialize state
         self._refresh_audio_devices()
         self._update_ui_state()
@@ -184,14 +511,27 @@ class WhisperTranscriber:
         # Language selection
         ttk.Label(dropdowns_frame, text="Language").grid(row=0, column=0, padx=(0, 5), sticky="w")
         self._gui_components["lang_var"] = tk.StringVar(value=self.config.default_language)
-        self._gui_components["lang_menu"] = ttk.Combobox(dropdowns_frame, textvariable=self._gui_components["lang_var"], values=list(self._languages.keys()), state="readonly", width=15)
+        self._gui_components["lang_menu"] = ttk.Combobox(dropdowns_frame, textvariable=self._gui_components["lang_var"], values=_LANGUAGE_NAMES, state="readonly", width=15)
         self._gui_components["lang_menu"].grid(row=0, column=1, padx=(0, 20), sticky="w")
 
         # Model selection
         ttk.Label(dropdowns_frame, text="Model").grid(row=0, column=2, padx=(0, 5), sticky="w")
         self._gui_components["model_var"] = tk.StringVar(value=self.config.default_model)
-        self._gui_components["model_menu"] = ttk.Combobox(dropdowns_frame, textvariable=self._gui_components["model_var"], values=self._models, state="readonly", width=15)
+        self._gui_components["model_menu"] = ttk.Combobox(dropdowns_frame, textvariable=self._gui_components["model_var"], values=_MODEL_NAMES, state="readonly", width=15)
         self._gui_components["model_menu"].grid(row=0, column=3, sticky="w")
+        self._gui_components["model_var"].trace_add("write", self._on_model_change)
+
+        # Dynamic int8 quantization (openai-whisper on CPU only, the other backends are int8 already)
+        if self.config.backend == "whisper" and resolve_device(self.config.device) == "cpu":
+            self._gui_components["quantize_var"] = tk.BooleanVar(value=self.config.quantize)
+            self._gui_components["quantize_check"] = ttk.Checkbutton(dropdowns_frame, text="Quantize (int8)", variable=self._gui_components["quantize_var"])
+            self._gui_components["quantize_check"].grid(row=1, column=0, columnspan=2, pady=(5, 0), sticky="w")
+            self._gui_components["quantize_var"].trace_add("write", self._on_model_change)
+
+        # Full beam search and temperature fallback instead of greedy dictation decoding
+        self._gui_components["accuracy_var"] = tk.BooleanVar(value=self.config.accuracy_mode)
+        self._gui_components["accuracy_check"] = ttk.Checkbutton(dropdowns_frame, text="Accuracy mode", variable=self._gui_components["accuracy_var"])
+        self._gui_components["accuracy_check"].grid(row=1, column=2, columnspan=2, pady=(5, 0), sticky="w")
 
     def _create_control_buttons_section(self, parent: ttk.Frame) -> None:
         """Create control buttons section."""
@@ -223,11 +563,17 @@ class WhisperTranscriber:
         text_widget.tag_configure("transcription", foreground="black", font=("Arial", 11))
         text_widget.tag_configure("device_info", foreground="blue", font=("Arial", 10))
         text_widget.tag_configure("error", foreground="red", font=("Arial", 10))
+        text_widget.tag_configure("provisional", foreground="gray", font=("Arial", 11, "italic"))
 
     def _update_status(self, text: str, color: str = "blue") -> None:
         """Update status label with text and color."""
-        if "status_label" in self._gui_components:
-            self._gui_components["status_label"].config(text=text, foreground=color)
+        if self._status_label is not None:
+            self._status_label.config(text=text, foreground=color)
+
+    def _run_on_ui(self, callback: Callable, *args) -> None:
+        """Run a GUI update on the Tk main loop; widgets must not be touched from worker threads."""
+        if self.root:
+            self.root.after(0, callback, *args)
 
     def _reset_status(self) -> None:
         """Reset status to idle if not busy."""
@@ -239,19 +585,19 @@ class WhisperTranscriber:
         busy = self.state.is_audio_busy
 
         # Update button states
-        if "test_audio_button" in self._gui_components:
+        if self._test_audio_button is not None:
             if self.state.is_testing_audio:
-                self._gui_components["test_audio_button"].config(text="Stop Test")
+                self._test_audio_button.config(text="Stop Test")
             else:
-                self._gui_components["test_audio_button"].config(text="Test Audio")
-            self._gui_components["test_audio_button"].config(state="normal" if not self.state.is_listening else "disabled")
+                self._test_audio_button.config(text="Test Audio")
+            self._test_audio_button.config(state="normal" if not self.state.is_listening else "disabled")
 
-        if "record_button" in self._gui_components:
+        if self._record_button is not None:
             if self.state.is_listening:
-                self._gui_components["record_button"].config(text="Stop Recording", style="Accent.TButton")
+                self._record_button.config(text="Stop Recording", style="Accent.TButton")
             else:
-                self._gui_components["record_button"].config(text="Start Recording", style="TButton")
-            self._gui_components["record_button"].config(state="normal" if not self.state.is_testing_audio else "disabled")
+                self._record_button.config(text="Start Recording", style="TButton")
+            self._record_button.config(state="normal" if not self.state.is_testing_audio else "disabled")
 
         # Update other controls
         for control_name in ["device_menu", "refresh_button"]:
@@ -259,38 +605,38 @@ class WhisperTranscriber:
                 state = "disabled" if busy else ("readonly" if control_name == "device_menu" else "normal")
                 self._gui_components[control_name].config(state=state)
 
-    def _append_to_display(self, text: str, tag: str | None = None) -> None:
-        """Append text to the display area with optional formatting."""
-        if "text_display" not in self._gui_components:
+    def _append_to_display(self, text: str, tag: str | None = None, index: str = tk.END) -> None:
+        """Append text to the display area, or insert it at a mark, with optional formatting."""
+        if self._text_display is None:
             return
 
-        text_widget = self._gui_components["text_display"]
+        text_widget = self._text_display
         text_widget.config(state=tk.NORMAL)
         if tag:
-            text_widget.insert(tk.END, text, tag)
+            text_widget.insert(index, text, tag)
         else:
-            text_widget.insert(tk.END, text)
-        text_widget.see(tk.END)
+            text_widget.insert(index, text)
+        text_widget.see(index)
         text_widget.config(state=tk.DISABLED)
 
     def _clear_text(self) -> None:
         """Clear the text display area."""
-        if "text_display" in self._gui_components:
-            text_widget = self._gui_components["text_display"]
+        if self._text_display is not None:
+            text_widget = self._text_display
             text_widget.config(state=tk.NORMAL)
             text_widget.delete(1.0, tk.END)
             text_widget.config(state=tk.DISABLED)
 
     def _copy_current_text(self) -> None:
         """Copy all text from display to clipboard."""
-        if "text_display" not in self._gui_components:
+        if self._text_display is None:
             return
 
-        text_widget = self._gui_components["text_display"]
+        text_widget = self._text_display
         current_text = text_widget.get(1.0, tk.END).strip()
 
         if current_text:
-            pyperclip.copy(current_text)
+            self._copy_to_clipboard(current_text)
             self._update_status("Text copied to clipboard!", "green")
             if self.root:
                 self.root.after(3000, self._reset_status)
@@ -299,26 +645,53 @@ class WhisperTranscriber:
             if self.root:
                 self.root.after(2000, self._reset_status)
 
+    def _copy_to_clipboard(self, text: str) -> None:
+        """Put text on the clipboard through Tk instead of spawning a clipboard helper process."""
+        if self.root:
+            self.root.clipboard_clear()
+            self.root.clipboard_append(text)
+            self.root.update_idletasks()
+
     def _refresh_audio_devices(self) -> None:
-        """Refresh the list of available audio devices."""
+        """Refresh the list of available audio devices in the background."""
         if self.state.is_audio_busy:
             self._update_status("Cannot refresh while audio is active", "orange")
             return
 
-        self._audio_devices = self.get_audio_devices()
+        threading.Thread(target=self._load_audio_devices, daemon=True).start()
+
+    def _load_audio_devices(self) -> None:
+        """Query input devices off the Tk thread, reusing the last result while it is fresh."""
+        # PortAudio can block for hundreds of milliseconds while it enumerates hardware
+        devices, default_device, loaded_at = self._device_cache
+        if time.monotonic() - loaded_at > self.config.device_cache_ttl:
+            devices, default_device = self.get_audio_devices(), self.get_default_input_device()
+            self._device_cache = (devices, default_device, time.monotonic())
+        self._run_on_ui(self._apply_audio_devices, devices, default_device)
+
+    def _apply_audio_devices(self, devices: list[AudioDeviceInfo], default_device: AudioDeviceInfo | None) -> None:
+        """Show a freshly loaded device list and switch the input stream to the default device if it changed."""
+        if self.state.is_audio_busy:
+            self._update_status("Cannot refresh while audio is active", "orange")
+            return
+
+        previous_device_index = self.state.current_device_index
+        self._audio_devices = devices
         device_names = [f"{device.name} ({device.index})" for device in self._audio_devices]
 
         if "device_menu" in self._gui_components:
             self._gui_components["device_menu"]["values"] = device_names
 
         # Set default device
-        default_device = self.get_default_input_device()
         if default_device and "device_var" in self._gui_components:
             default_name = f"{default_device.name} ({default_device.index})"
             if default_name in device_names:
                 self._gui_components["device_var"].set(default_name)
                 self._update_device_info(default_device)
 
+        # Opening a PortAudio stream blocks, so the open stream is kept unless the device changed
+        if self.state.current_device_index != previous_device_index or self.state._input_stream is None:
+            self._restart_input_stream()
         self._append_to_display(f"\nRefreshed audio devices. Found {len(self._audio_devices)} input devices.\n", "device_info")
 
     def _update_device_info(self, device: AudioDeviceInfo) -> None:
@@ -347,30 +720,92 @@ class WhisperTranscriber:
             for device in self._audio_devices:
                 if device.index == device_index:
                     self._update_device_info(device)
+                    self._restart_input_stream()
                     self._append_to_display(f"\nSwitched to audio device: {device.name}\n", "device_info")
                     break
         except (ValueError, IndexError):
             self._log_error("Failed to parse device selection")
 
-    def _cleanup_audio_streams(self) -> None:
-        """Safely cleanup all audio streams."""
+    def _get_model_selection(self) -> tuple[str, bool]:
+        """Get the currently selected model name and quantization setting."""
+        model_name = self.config.default_model
+        quantize = self.config.quantize
+
+        if "model_var" in self._gui_components:
+            model_name = self._gui_components["model_var"].get()
+
+        if "quantize_var" in self._gui_components:
+            quantize = self._gui_components["quantize_var"].get()
+
+        return model_name, quantize
+
+    def _get_language_code(self) -> str | None:
+        """Get the Whisper language code for the selected language, None for autodetect."""
+        if "lang_var" in self._gui_components:
+            return _LANGUAGE_CODES.get(self._gui_components["lang_var"].get())
+        return _LANGUAGE_CODES.get(self.config.default_language)
+
+    def _get_accuracy_mode(self) -> bool:
+        """Check whether accuracy mode decoding is selected."""
+        if "accuracy_var" in self._gui_components:
+            return self._gui_components["accuracy_var"].get()
+        return self.config.accuracy_mode
+
+    def _on_model_change(self, *args) -> None:
+        """Start loading the newly selected model in the background."""
+        self._preload_model()
+
+    def _preload_model(self) -> None:
+        """Load and warm up the selected model on a background thread, releasing any other cached model."""
+        model_name, quantize = self._get_model_selection()
+
+        def load() -> None:
+            try:
+                model = get_model(model_name, self.config.backend, self.config.device, quantize, self.config.compute_type, self.config.use_compile, exclusive=True)
+                warm_up(model)
+            except Exception as e:
+                self._log_error(f"Error preloading model {model_name}: {e}")
+
+        threading.Thread(target=load, daemon=True).start()
+
+    def _open_input_stream(self) -> None:
+        """Open and start the persistent input stream on the selected device."""
+        self._close_input_stream()
+        stream = sd.InputStream(
+            samplerate=self.config.sample_rate,
+            channels=1,
+            dtype="int16",
+            blocksize=self.config.block_size,
+            latency=self.config.latency_mode,
+            callback=self._audio_callback,
+            device=self.state.current_device_index,
+        )
+        stream.start()
+        self.state._input_stream = stream
+
+    def _ensure_input_stream(self) -> None:
+        """Reopen the input stream if it is missing or has stopped, e.g. after a device error."""
+        stream = self.state._input_stream
+        if stream is None or not stream.active:
+            self._open_input_stream()
+
+    def _restart_input_stream(self) -> None:
+        """Reopen the input stream after a device change, logging failures instead of raising."""
         try:
-            if self.state._recording_stream and hasattr(self.state._recording_stream, "active"):
-                if self.state._recording_stream.active:
-                    self.state._recording_stream.stop()
-                    self.state._recording_stream.close()
-                self.state._recording_stream = None
+            self._open_input_stream()
         except Exception as e:
-            self._log_error(f"Error closing recording stream: {e}")
+            self._log_error(f"Error opening input stream: {e}")
+
+    def _close_input_stream(self) -> None:
+        """Safely stop and close the persistent input stream."""
+        stream, self.state._input_stream = self.state._input_stream, None
+        if stream is None:
+            return
 
         try:
-            if self.state._test_stream and hasattr(self.state._test_stream, "active"):
-                if self.state._test_stream.active:
-                    self.state._test_stream.stop()
-                    self.state._test_stream.close()
-                self.state._test_stream = None
+            stream.close()
         except Exception as e:
-            self._log_error(f"Error closing test stream: {e}")
+            self._log_error(f"Error closing input stream: {e}")
 
     def _toggle_audio_test(self) -> None:
         """Toggle audio testing on/off."""
@@ -378,10 +813,10 @@ class WhisperTranscriber:
             if self.state.is_testing_audio:
                 # Stop current test
                 self.state.is_testing_audio = False
-                self._cleanup_audio_streams()
+                self.state._test_stop.set()
                 self._update_status("Audio test stopped", "orange")
-                if "audio_level_label" in self._gui_components:
-                    self._gui_components["audio_level_label"].config(text="Audio Level: --")
+                if self._audio_level_label is not None:
+                    self._audio_level_label.config(text="Audio Level: --")
                 self._update_ui_state()
                 if self.root:
                     self.root.after(1000, self._reset_status)
@@ -392,45 +827,39 @@ class WhisperTranscriber:
                 return
 
             self.state.is_testing_audio = True
+            self.state._test_stop.clear()
 
         self._update_status("Testing audio input...", "orange")
         self._update_ui_state()
         threading.Thread(target=self._run_audio_test, daemon=True).start()
+        self._poll_audio_level()
+
+    def _poll_audio_level(self) -> None:
+        """Show the latest audio test level at 20 Hz, independent of how often the device delivers blocks."""
+        if not self.state.is_testing_audio or not self.root:
+            return
+
+        level, self.state._latest_level = self.state._latest_level, None
+        if level is not None and self._audio_level_label is not None:
+            self._audio_level_label.config(text=f"Audio Level: {'█' * min(int(level), 20)} ({level:.1f})")
+        self.root.after(50, self._poll_audio_level)
 
     def _run_audio_test(self) -> None:
         """Run audio level testing in background thread."""
         try:
-            device_index = self.state.current_device_index
-
-            def callback(indata, frames, time, status):
-                if not self.state.is_testing_audio:
-                    raise sd.CallbackAbort
-                if status:
-                    print(f"Test audio status: {status}")
-
-                volume_norm = np.linalg.norm(indata) * 10
-                level_text = f"Audio Level: {'█' * min(int(volume_norm), 20)} ({volume_norm:.1f})"
-
-                if self.root and "audio_level_label" in self._gui_components:
-                    self.root.after(0, lambda: self._gui_components["audio_level_label"].config(text=level_text))
-
+            # Levels are reported by the shared input stream's callback while testing
             with self.state._audio_lock:
                 if not self.state.is_testing_audio:
                     return
 
-                self.state._test_stream = sd.InputStream(callback=callback, device=device_index, channels=1, samplerate=self.config.sample_rate)
-                self.state._test_stream.start()
+                self._ensure_input_stream()
 
             # Wait for test duration or until cancelled
-            for _ in range(self.config.test_duration * 10):
-                if not self.state.is_testing_audio:
-                    break
-                time.sleep(0.1)
+            self.state._test_stop.wait(self.config.test_duration)
 
             # Cleanup
             with self.state._audio_lock:
                 self.state.is_testing_audio = False
-                self._cleanup_audio_streams()
 
             if self.root:
                 self.root.after(0, self._audio_test_complete)
@@ -439,7 +868,6 @@ class WhisperTranscriber:
             error_msg = f"Audio test failed: {str(e)}"
             with self.state._audio_lock:
                 self.state.is_testing_audio = False
-                self._cleanup_audio_streams()
 
             if self.root:
                 self.root.after(0, lambda: self._audio_test_error(error_msg))
@@ -447,8 +875,8 @@ class WhisperTranscriber:
     def _audio_test_complete(self) -> None:
         """Handle successful audio test completion."""
         self._update_status("Audio test complete", "green")
-        if "audio_level_label" in self._gui_components:
-            self._gui_components["audio_level_label"].config(text="Audio Level: --")
+        if self._audio_level_label is not None:
+            self._audio_level_label.config(text="Audio Level: --")
         self._update_ui_state()
         if self.root:
             self.root.after(3000, self._reset_status)
@@ -456,8 +884,8 @@ class WhisperTranscriber:
     def _audio_test_error(self, error_msg: str) -> None:
         """Handle audio test error."""
         self._update_status(error_msg, "red")
-        if "audio_level_label" in self._gui_components:
-            self._gui_components["audio_level_label"].config(text="Audio Level: --")
+        if self._audio_level_label is not None:
+            self._audio_level_label.config(text="Audio Level: --")
         self._append_to_display(f"\n{error_msg}\n", "error")
         self._update_ui_state()
         if self.root:
@@ -474,13 +902,39 @@ class WhisperTranscriber:
         else:
             self._start_recording()
 
-    def _record_callback(self, indata, frames, time_, status):
-        """Callback for audio recording."""
-        if not self.state.is_listening:
-            raise sd.CallbackAbort
-        if status:
-            print(f"Recording status: {status}")
-        self.state._recording_data.append(indata.copy())
+    def _audio_callback(self, indata, frames, time_, status):
+        """Callback for the persistent input stream, feeding the audio test and recording."""
+        if status and self.state.is_audio_busy:
+            print(f"Audio input status: {status}")
+
+        if self.state.is_testing_audio:
+            # Sum of squares accumulated in float64 straight from the int16 block, skipping norm's float copy.
+            # Stored as a plain float that the GUI picks up on its own schedule.
+            self.state._latest_level = math.sqrt(np.einsum("ij,ij->", indata, indata, dtype=np.float64)) / 32768 * 10
+
+        # The stream stays open between recordings; blocks are only kept while listening
+        buffer = self.state._recording_buffer
+        if not self.state.is_listening or buffer is None:
+            return
+
+        # Copy straight into the preallocated buffer; samples past its capacity are dropped
+        start = self.state._recording_length
+        end = min(start + frames, len(buffer))
+        np.copyto(buffer[start:end], indata[: end - start])
+        self.state._recording_length = end
+
+    def _poll_recording_full(self, buffer: np.ndarray) -> None:
+        """Check from the Tk loop whether the recording has filled its buffer, stopping it once it has."""
+        # Polled rather than signalled, since the audio callback must not block on the Tk loop
+        if not self.state.is_listening or self.state._recording_buffer is not buffer or not self.root:
+            return
+        if self.state._recording_length < len(buffer):
+            self.root.after(200, self._poll_recording_full, buffer)
+            return
+
+        timestamp = time.strftime("%H:%M:%S")
+        self._append_to_display(f"\n[{timestamp}] Maximum recording length of {self.config.max_recording_duration}s reached\n", "error")
+        self._stop_recording()
 
     def _start_recording(self) -> None:
         """Start audio recording."""
@@ -488,9 +942,13 @@ class WhisperTranscriber:
             if self.state.is_audio_busy:
                 self._update_status("Audio system busy", "orange")
                 return
+
+            # A fresh buffer keeps the previous recording intact while it is still being transcribed.
+            # np.empty only reserves address space, pages are committed as the callback fills them.
+            self.state._recording_buffer = np.empty((self.config.sample_rate * self.config.max_recording_duration, 1), dtype=np.int16)
+            self.state._recording_length = 0
             self.state.is_listening = True
 
-        self.state._recording_data.clear()
         self._update_status("Listening...", "red")
         self._update_ui_state()
 
@@ -501,8 +959,13 @@ class WhisperTranscriber:
                 if not self.state.is_listening:
                     return
 
-                self.state._recording_stream = sd.InputStream(samplerate=self.config.sample_rate, channels=1, callback=self._record_callback, device=device_index)
-                self.state._recording_stream.start()
+                # Normally already open, so starting is just the flag flip above
+                self._ensure_input_stream()
+
+            self._poll_recording_full(self.state._recording_buffer)
+
+            if self.config.streaming:
+                self._start_streaming()
 
             # Show which device is being used
             device_name = "Default"
@@ -515,7 +978,7 @@ class WhisperTranscriber:
         except Exception as e:
             with self.state._audio_lock:
                 self.state.is_listening = False
-                self._cleanup_audio_streams()
+                self.state._recording_buffer = None
 
             error_msg = f"Failed to start recording: {str(e)}"
             self._update_status(error_msg, "red")
@@ -524,97 +987,224 @@ class WhisperTranscriber:
             if self.root:
                 self.root.after(3000, self._reset_status)
 
+    def _start_streaming(self) -> None:
+        """Start transcribing the current recording window by window in the background."""
+        progress = StreamProgress()
+        thread = threading.Thread(target=self._stream_transcribe, args=(self.state._recording_buffer, progress), daemon=True)
+        self.state._stream_progress = progress
+        self.state._stream_thread = thread
+        thread.start()
+
+    def _stream_transcribe(self, buffer: np.ndarray, progress: StreamProgress) -> None:
+        """Commit transcript text for full windows of audio while the recording grows, previewing the rest in between."""
+        window = int(self.config.stream_window * self.config.sample_rate)
+        # A window whose only segment runs into its end is retried once as a full 30 s model window
+        max_span = max(window, N_SAMPLES)
+        edge = self.config.sample_rate
+        try:
+            model_name, quantize = self._get_model_selection()
+            lang_code = self._get_language_code()
+            accurate = self._get_accuracy_mode()
+            model = get_model(model_name, self.config.backend, self.config.device, quantize, self.config.compute_type, self.config.use_compile)
+            # The ONNX model returns one segment per 30 s chunk with no word timing, so it only decodes full windows
+            full_windows_only = isinstance(model, OnnxWhisper)
+            needed = max_span if full_windows_only else window
+            last_preview = time.monotonic()
+            while self.state.is_listening and self.state._recording_buffer is buffer:
+                time.sleep(0.5)
+                available = self.state._recording_length - progress.samples
+                if available < needed:
+                    # Each preview is one extra decode of the uncommitted audio, replaced on screen by the next
+                    interval = self.config.stream_preview_interval
+                    if interval and time.monotonic() - last_preview >= interval and available >= self.config.sample_rate:
+                        audio = pcm16_to_float32(buffer[progress.samples : progress.samples + min(available, max_span)])
+                        preview = "".join(segment.text for segment in transcribe_segments(model, audio, lang_code, progress.text or None, accurate))
+                        if preview.strip() or progress.started:
+                            self._run_on_ui(self._update_stream_line, "", preview, not progress.started)
+                            progress.started = True
+                        last_preview = time.monotonic()
+                    continue
+
+                span = min(available, max_span)
+                audio = pcm16_to_float32(buffer[progress.samples : progress.samples + span])
+                segments = transcribe_segments(model, audio, lang_code, progress.text or None, accurate)
+
+                # The last segment may be cut mid-word, so it is decoded again as the start of the next window.
+                # Timestamps can run past the real audio into Whisper's padding, so they are clamped to the span.
+                consumed = 0
+                if len(segments) > 1 and not full_windows_only:
+                    consumed = min(int(segments[-2].end * self.config.sample_rate), span)
+                if 0 < consumed < span:
+                    committed = segments[:-1]
+                elif len(segments) == 1 and not full_windows_only and segments[0].end * self.config.sample_rate > span - edge and span < max_span:
+                    # A lone segment reaching the edge may be cut mid-word too; wait for a full window instead
+                    needed = max_span
+                    continue
+                else:
+                    committed, consumed = segments, span
+                needed = max_span if full_windows_only else window
+
+                text = "".join(segment.text for segment in committed)
+                if text.strip() or progress.started:
+                    # The preview covered audio that is now committed, so it is cleared until the next one
+                    self._run_on_ui(self._update_stream_line, text, "", not progress.started)
+                    progress.started = True
+                    last_preview = time.monotonic()
+                progress.text += text
+                progress.samples += consumed
+        except Exception as e:
+            self._log_error(f"Streaming transcription failed: {e}")
+
     def _stop_recording(self) -> None:
         """Stop audio recording and start transcription."""
         with self.state._audio_lock:
             self.state.is_listening = False
-            self._cleanup_audio_streams()
+
+            # The callback stops writing once listening is off, so this view will not change any
+            # more. Handing it over frees the recording as soon as transcription is done with it.
+            audio = self.state._recording_buffer[: self.state._recording_length]
+            self.state._recording_buffer = None
+        stream_thread, progress = self.state._stream_thread, self.state._stream_progress
+        self.state._stream_thread = self.state._stream_progress = None
 
         self._update_ui_state()
         self._update_status("Transcribing...", "orange")
-        threading.Thread(target=self._transcribe_audio, daemon=True).start()
+        self.state._transcription_jobs.put((audio, stream_thread, progress))
+
+    def _transcription_worker(self) -> None:
+        """Transcribe finished recordings one at a time for the lifetime of the app."""
+        while True:
+            self._transcribe_audio(*self.state._transcription_jobs.get())
 
-    def _transcribe_audio(self) -> None:
-        """Transcribe recorded audio using Whisper."""
+    def _transcribe_audio(self, audio: np.ndarray, stream_thread: threading.Thread | None = None, progress: StreamProgress | None = None) -> None:
+        """Transcribe recorded audio using Whisper on a worker thread, handing GUI updates to the Tk loop."""
         try:
-            if not self.state._recording_data:
-                self._update_status("No audio recorded", "red")
+            if not len(audio):
+                self._run_on_ui(self._update_status, "No audio recorded", "red")
                 if self.root:
                     self.root.after(2000, self._reset_status)
                 return
 
-            audio = np.concatenate(self.state._recording_data, axis=0)
+            # Let the streaming worker finish its current window before taking over
+            if stream_thread is not None:
+                stream_thread.join()
+
+            # Captured as int16; Whisper takes 16 kHz mono float32 directly, with no WAV/ffmpeg round-trip
+            audio = pcm16_to_float32(audio)
 
             # Audio analysis
             audio_duration = len(audio) / self.config.sample_rate
-            audio_max = np.max(np.abs(audio))
-            audio_rms = np.sqrt(np.mean(audio**2))
+            audio_max, audio_rms = audio_stats(audio)
 
             stats_text = f"Audio stats - Duration: {audio_duration:.1f}s, Max: {audio_max:.3f}, RMS: {audio_rms:.3f}\n"
-            self._append_to_display(stats_text, "timestamp")
+            self._run_on_ui(self._append_to_display, stats_text, "timestamp")
 
             # Validation checks
             if audio_duration < self.config.min_recording_duration:
-                self._update_status("Recording too short", "red")
+                self._run_on_ui(self._update_status, "Recording too short", "red")
                 if self.root:
                     self.root.after(2000, self._reset_status)
                 return
 
             if audio_max < self.config.silence_threshold:
-                self._update_status("No audio detected - check microphone", "red")
-                self._append_to_display("Try the 'Test Audio' button to check your microphone levels.\n", "timestamp")
+                self._run_on_ui(self._update_status, "No audio detected - check microphone", "red")
+                self._run_on_ui(self._append_to_display, "Try the 'Test Audio' button to check your microphone levels.\n", "timestamp")
                 if self.root:
                     self.root.after(3000, self._reset_status)
                 return
 
-            # Transcribe with Whisper
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-                wav.write(f.name, self.config.sample_rate, audio)
-
-                # Get current selections
-                lang_code = None
-                model_name = self.config.default_model
-
-                if "lang_var" in self._gui_components:
-                    selected_lang = self._gui_components["lang_var"].get()
-                    lang_code = self._languages.get(selected_lang)
-
-                if "model_var" in self._gui_components:
-                    model_name = self._gui_components["model_var"].get()
-
-                # Load and run model
-                self._update_status("Loading model...", "orange")
-                model = whisper.load_model(model_name)
-
-                self._update_status("Transcribing...", "orange")
-                result = model.transcribe(f.name, language=lang_code) if lang_code else model.transcribe(f.name)
-
-                transcribed_text = str(result.get("text", "")).strip()
-
-                if transcribed_text:
-                    # Display and copy result
-                    timestamp = time.strftime("%H:%M:%S")
-                    self._append_to_display(f"\n[{timestamp}] ", "timestamp")
-                    self._append_to_display(f"{transcribed_text}\n", "transcription")
-
-                    pyperclip.copy(transcribed_text)
-                    self._update_status("Transcribed & copied to clipboard!", "green")
-                else:
-                    self._update_status("No speech detected", "orange")
-                    timestamp = time.strftime("%H:%M:%S")
-                    self._append_to_display(f"\n[{timestamp}] No speech detected\n", "timestamp")
+            # Get current selections
+            model_name, quantize = self._get_model_selection()
+            lang_code = self._get_language_code()
+            accurate = self._get_accuracy_mode()
+
+            # Load and run model
+            self._run_on_ui(self._update_status, "Loading model...", "orange")
+            model = get_model(model_name, self.config.backend, self.config.device, quantize, self.config.compute_type, self.config.use_compile)
+
+            # Only the tail that streaming has not committed yet still needs decoding
+            progress = progress or StreamProgress()
+            # Dropping the silence around the speech before anything else shortens both VAD and the encoder input
+            tail = trim_silence(audio[progress.samples :])
+
+            # faster-whisper runs the same Silero VAD internally via vad_filter
+            if self.config.vad_filter and self.config.backend != "faster-whisper":
+                tail = self._remove_silence(tail)
+
+            self._run_on_ui(self._update_status, "Transcribing...", "orange")
+            tail_text = transcribe(model, tail, lang_code, progress.text or None, accurate) if len(tail) else ""
+            transcribed_text = (progress.text + tail_text).strip()
+
+            if transcribed_text and progress.started:
+                # The recording's line is already on screen, so only the tail is added to it
+                remainder = tail_text if progress.text.strip() else tail_text.lstrip()
+                self._run_on_ui(self._show_transcription, transcribed_text, remainder)
+            elif transcribed_text:
+                self._run_on_ui(self._show_transcription, transcribed_text)
+            else:
+                if progress.started:
+                    self._run_on_ui(self._update_stream_line, "", "", False)
+                self._run_on_ui(self._update_status, "No speech detected", "orange")
+                timestamp = time.strftime("%H:%M:%S")
+                self._run_on_ui(self._append_to_display, f"\n[{timestamp}] No speech detected\n", "timestamp")
 
         except Exception as e:
             error_msg = f"Error: {str(e)}"
-            self._update_status(error_msg, "red")
+            self._run_on_ui(self._update_status, error_msg, "red")
             timestamp = time.strftime("%H:%M:%S")
-            self._append_to_display(f"\n[{timestamp}] {error_msg}\n", "error")
+            self._run_on_ui(self._append_to_display, f"\n[{timestamp}] {error_msg}\n", "error")
 
         finally:
             # Reset status and UI
             if self.root:
                 self.root.after(5000, lambda: [self._reset_status(), self._update_ui_state()])
 
+    def _update_stream_line(self, committed: str, preview: str, first: bool) -> None:
+        """Add committed text to the recording's line and replace its provisional text with a new preview."""
+        if self._text_display is None:
+            return
+
+        text_widget = self._text_display
+        if first:
+            timestamp = time.strftime("%H:%M:%S")
+            self._append_to_display(f"\n[{timestamp}] ", "timestamp")
+            self._append_to_display("\n")
+            # The line is ended right away so later messages start below it; streamed text goes in before the break
+            text_widget.mark_set("stream_end", "end-2c")
+            committed, preview = committed.lstrip(), preview.lstrip()
+
+        text_widget.config(state=tk.NORMAL)
+        if text_widget.tag_ranges("provisional"):
+            text_widget.delete("provisional.first", "provisional.last")
+        text_widget.insert("stream_end", committed, "transcription")
+        if preview:
+            # Inserting at the mark moves it past the preview, so it is set back to keep committed text ahead of it
+            text_widget.insert("stream_end", preview, "provisional")
+            text_widget.mark_set("stream_end", "provisional.first")
+        text_widget.see("stream_end")
+        text_widget.config(state=tk.DISABLED)
+
+    def _show_transcription(self, text: str, remainder: str | None = None) -> None:
+        """Display a finished transcription, or the rest of one already streamed, and copy it to the clipboard."""
+        if remainder is None:
+            timestamp = time.strftime("%H:%M:%S")
+            self._append_to_display(f"\n[{timestamp}] ", "timestamp")
+            self._append_to_display(f"{text}\n", "transcription")
+        else:
+            # Continue the streamed line, which already ends in a line break, in place of the last preview
+            self._update_stream_line(remainder.rstrip(), "", False)
+
+        self._copy_to_clipboard(text)
+        self._update_status("Transcribed & copied to clipboard!", "green")
+
+    def _remove_silence(self, audio: np.ndarray) -> np.ndarray:
+        """Cut silence from audio with Silero VAD, keeping it untouched if VAD is unavailable."""
+        try:
+            return remove_silence(audio)
+        except Exception as e:
+            self._log_error(f"Voice activity detection failed: {e}")
+            return audio
+
     def _show_welcome_message(self) -> None:
         """Display welcome message in the text area."""
         welcome_text = f"""Welcome to Whisper Transcriber!
@@ -634,20 +1224,55 @@ Ready to transcribe!
         """Log error messages (could be extended to use proper logging)."""
         print(f"ERROR: {message}")
 
+    def _on_close(self) -> None:
+        """Release the audio device and close the window."""
+        self.state.is_listening = False
+        self.state.is_testing_audio = False
+        self.state._test_stop.set()
+        self._close_input_stream()
+        if self._hotkey_listener:
+            self._hotkey_listener.stop()
+        if self.root:
+            self.root.destroy()
+
     def run(self) -> None:
         """Start the application."""
+        # Process-wide, so set once here rather than per loaded model
+        if self.config.compute_type == "bfloat16":
+            torch.set_float32_matmul_precision("medium")
+
         self.setup_gui()
 
+        # Load the default model while the user reads the welcome message
+        if self.config.warmup_on_start:
+            self._preload_model()
+        threading.Thread(target=self._transcription_worker, daemon=True).start()
+
         # Set up global hotkey
-        keyboard.add_hotkey(self.config.hotkey, self._toggle_recording)
+        # The hotkey fires on pynput's listener thread, so hand the toggle to the Tk loop
+        self._hotkey_listener = GlobalHotKeys({to_pynput_hotkey(self.config.hotkey): lambda: self._run_on_ui(self._toggle_recording)})
+        self._hotkey_listener.start()
 
         # Start GUI main loop
         if self.root:
             self.root.mainloop()
 
 
+def to_pynput_hotkey(hotkey: str) -> str:
+    """Convert a hotkey such as "ctrl+shift+space" to pynput's "<ctrl>+<shift>+<space>" syntax."""
+    keys = (key.strip().lower().replace(" ", "_") for key in hotkey.split("+"))
+    return "+".join(key if len(key) == 1 else f"<{key}>" for key in keys)
+
+
+def configure_threads() -> None:
+    """Limit PyTorch CPU inference to one thread per physical core and a single inter-op thread."""
+    torch.set_num_threads(_CPU_THREADS)
+    torch.set_num_interop_threads(1)
+
+
 def main() -> None:
     """Application entry point."""
+    configure_threads()
     config = TranscriberConfig()
     app = WhisperTranscriber(config)
     app.run()